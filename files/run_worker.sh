@@ -30,6 +30,10 @@ popd
 DEFAULT_QUEUES="short-running,long-running"
 QUEUES="${QUEUES:-$DEFAULT_QUEUES}"
 
+# how many messages a worker process reserves from the broker at once
+DEFAULT_PREFETCH_MULTIPLIER=1
+PREFETCH_MULTIPLIER="${PREFETCH_MULTIPLIER:-$DEFAULT_PREFETCH_MULTIPLIER}"
+
 if [[ "${CELERY_COMMAND}" == "beat" ]]; then
     # when using the database backend, celery beat must be running for the results to be expired.
     # https://docs.celeryproject.org/en/stable/userguide/periodic-tasks.html#starting-the-scheduler
@@ -39,5 +43,5 @@ elif [[ "${CELERY_COMMAND}" == "worker" ]]; then
     # concurrency: Number of concurrent worker processes/threads/green threads executing tasks.
     # prefetch-multiplier: How many messages to prefetch at a time multiplied by the number of concurrent processes.
     # http://docs.celeryproject.org/en/latest/userguide/optimizing.html#prefetch-limits
-    exec celery --app="${APP}" worker --loglevel=${LOGLEVEL} --concurrency=1 --prefetch-multiplier=1 --queues="${QUEUES}"
+    exec celery --app="${APP}" worker --loglevel=${LOGLEVEL} --concurrency=1 --prefetch-multiplier="${PREFETCH_MULTIPLIER}" --queues="${QUEUES}"
 fi
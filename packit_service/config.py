@@ -1,12 +1,21 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import copy
 import enum
 import logging
+import re
+import threading
 from pathlib import Path
-from typing import List, Optional, Set, Union, NamedTuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
-from yaml import safe_load
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # libyaml bindings are not available, fall back to the pure-Python parser
+    from yaml import SafeLoader as _YamlLoader
 
 from ogr.abstract import GitProject, Issue
 from packit.config import (
@@ -18,15 +27,22 @@ from packit.config import (
 from packit.exceptions import PackitConfigException, PackitException
 from packit_service.constants import (
     CONFIG_FILE_NAME,
+    MSG_DEPRECATED_OPTIONS,
+    PACKAGE_CONFIG_CACHE_SIZE,
+    PACKAGE_CONFIG_CACHE_TTL,
     SANDCASTLE_DEFAULT_PROJECT,
     SANDCASTLE_IMAGE,
     SANDCASTLE_PVC,
     SANDCASTLE_WORK_DIR,
     TESTING_FARM_API_URL,
 )
+from packit_service.utils import TimedLRUCache
 
 logger = logging.getLogger(__name__)
 
+# full SHA-1/SHA-256 commit hash, unlike a branch it always refers to the same content
+COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
 
 class Deployment(enum.Enum):
     dev = "dev"
@@ -46,29 +62,13 @@ class ProjectToSync(NamedTuple):
     dg_repo_name: str
     dg_branch: str
 
-    def __repr__(self):
-        return (
-            f"ProjectToSync(forge={self.forge}, repo_namespace={self.repo_namespace}, "
-            f"repo_name={self.repo_name}, branch={self.branch}, "
-            f"dg_repo_name={self.dg_repo_name}, dg_branch={self.dg_branch})"
-        )
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, ProjectToSync):
-            raise NotImplementedError()
-
-        return (
-            self.forge == other.forge
-            and self.repo_name == other.repo_name
-            and self.repo_namespace == other.repo_namespace
-            and self.branch == other.branch
-            and self.dg_repo_name == other.dg_repo_name
-            and self.dg_branch == other.dg_branch
-        )
-
 
 class ServiceConfig(Config):
     service_config = None
+    # guards the lazy initialization of service_config
+    _lock = threading.Lock()
+    # schema instance reused for every load, created on the first one
+    _schema = None
 
     def __init__(
         self,
@@ -172,7 +172,9 @@ class ServiceConfig(Config):
         # required to avoid circular imports
         from packit_service.schema import ServiceConfigSchema
 
-        config = ServiceConfigSchema().load(raw_dict)
+        if cls._schema is None:
+            cls._schema = ServiceConfigSchema()
+        config = cls._schema.load(raw_dict)
 
         config.server_name = raw_dict.get("server_name", "localhost:5000")
 
@@ -204,32 +206,96 @@ class ServiceConfig(Config):
     @classmethod
     def get_service_config(cls) -> "ServiceConfig":
         if cls.service_config is None:
-            directory = Path.home() / ".config"
-            config_file_name_full = directory / CONFIG_FILE_NAME
-            logger.debug(f"Loading service config from directory: {directory}")
+            with cls._lock:
+                # another thread might have loaded the config while we were waiting
+                if cls.service_config is None:
+                    cls.service_config = cls._load_service_config()
+        return cls.service_config
+
+    @classmethod
+    def preload(cls) -> None:
+        """
+        Load the service config in advance,
+        e.g. in the parent process so that forked workers inherit it.
+        """
+        cls.get_service_config()
 
-            try:
-                loaded_config = safe_load(open(config_file_name_full))
-            except Exception as ex:
-                logger.error(f"Cannot load service config '{config_file_name_full}'.")
-                raise PackitException(f"Cannot load service config: {ex}.")
+    @classmethod
+    def _load_service_config(cls) -> "ServiceConfig":
+        directory = Path.home() / ".config"
+        config_file_name_full = directory / CONFIG_FILE_NAME
+        logger.debug(f"Loading service config from directory: {directory}")
 
-            cls.service_config = ServiceConfig.get_from_dict(raw_dict=loaded_config)
-        return cls.service_config
+        try:
+            loaded_config = yaml.load(
+                config_file_name_full.read_bytes(), Loader=_YamlLoader
+            )
+        except Exception as ex:
+            logger.error(f"Cannot load service config '{config_file_name_full}'.")
+            raise PackitException(f"Cannot load service config: {ex}.")
+
+        return ServiceConfig.get_from_dict(raw_dict=loaded_config)
+
+    @property
+    def projects_to_sync(self) -> List[ProjectToSync]:
+        return self._projects_to_sync
+
+    @projects_to_sync.setter
+    def projects_to_sync(self, projects_to_sync: List[ProjectToSync]):
+        self._projects_to_sync = projects_to_sync
+        # (dg_repo_name, dg_branch) -> the first matching project
+        self._projects_to_sync_by_dg: Dict[Tuple[str, str], ProjectToSync] = {}
+        for project in projects_to_sync:
+            self._projects_to_sync_by_dg.setdefault(
+                (project.dg_repo_name, project.dg_branch), project
+            )
 
     def get_project_to_sync(self, dg_repo_name, dg_branch) -> Optional[ProjectToSync]:
-        projects = [
-            project
-            for project in self.projects_to_sync
-            if project.dg_repo_name == dg_repo_name and project.dg_branch == dg_branch
-        ]
-        if projects:
-            logger.info(f"Found project to sync: {projects[0]}.")
-            return projects[0]
-        return None
+        project = self._projects_to_sync_by_dg.get((dg_repo_name, dg_branch))
+        if project:
+            logger.info(f"Found project to sync: {project}.")
+        return project
 
 
 class PackageConfigGetter:
+    # package configs fetched from the forges
+    # (the same config is requested by many events of a single pull request)
+    cache = TimedLRUCache(
+        maxsize=PACKAGE_CONFIG_CACHE_SIZE, ttl=PACKAGE_CONFIG_CACHE_TTL
+    )
+
+    @staticmethod
+    def fetch_package_config(
+        project: GitProject,
+        reference: Optional[str] = None,
+        spec_file_path: Optional[str] = None,
+    ) -> Optional[PackageConfig]:
+        """
+        Get the package config from the repository, reuse the recently fetched ones.
+
+        Only configs fetched for a commit hash are cached, branches move
+        and a missing config can be added by the next push.
+
+        A copy is returned: the callers modify the config for their event
+        (e.g. upstream_project_url) and so does packit while running a job.
+        Copying is still much cheaper than fetching and loading the config again.
+        """
+        if not (reference and COMMIT_SHA_RE.fullmatch(reference)):
+            return get_package_config_from_repo(
+                project=project, ref=reference, spec_file_path=spec_file_path
+            )
+
+        key = (project.service, project.full_repo_name, reference, spec_file_path)
+        package_config = PackageConfigGetter.cache.get(key)
+        if not package_config:
+            package_config = get_package_config_from_repo(
+                project=project, ref=reference, spec_file_path=spec_file_path
+            )
+            if not package_config:
+                return None
+            PackageConfigGetter.cache.set(key, package_config)
+        return copy.deepcopy(package_config)
+
     @staticmethod
     def create_issue_if_needed(
         project: GitProject, title: str, message: str
@@ -262,9 +328,9 @@ class PackageConfigGetter:
 
         project_to_search_in = base_project or project
         try:
-            package_config: PackageConfig = get_package_config_from_repo(
+            package_config = PackageConfigGetter.fetch_package_config(
                 project=project_to_search_in,
-                ref=reference,
+                reference=reference,
                 spec_file_path=spec_file_path,
             )
             if not package_config and fail_when_missing:
@@ -288,15 +354,8 @@ class PackageConfigGetter:
                     if package_config.create_tarball_command
                     else ""
                 )
-                message = (
-                    "Your config appears to use:\n"
-                    f"{current_version_set}{create_tarball_set}"
-                    "Those options will soon be deprecated and superseded by actions, "
-                    "please adjust you packit configuration.\n\n"
-                    "For more info, please check out the documentation: "
-                    "https://packit.dev/docs/actions/ or contact us - "
-                    "[Packit team]"
-                    "(https://github.com/orgs/packit/teams/the-packit-team)"
+                message = MSG_DEPRECATED_OPTIONS.format(
+                    options=f"{current_version_set}{create_tarball_set}"
                 )
 
                 if created_issue := PackageConfigGetter.create_issue_if_needed(
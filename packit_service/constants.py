@@ -28,6 +28,17 @@ MSG_RETRIGGER = (
 
 FILE_DOWNLOAD_FAILURE = "Failed to download file from URL"
 
+MSG_DEPRECATED_OPTIONS = (
+    "Your config appears to use:\n"
+    "{options}"
+    "Those options will soon be deprecated and superseded by actions, "
+    "please adjust you packit configuration.\n\n"
+    "For more info, please check out the documentation: "
+    "https://packit.dev/docs/actions/ or contact us - "
+    "[Packit team]"
+    "(https://github.com/orgs/packit/teams/the-packit-team)"
+)
+
 PERMISSIONS_ERROR_WRITE_OR_ADMIN = (
     "Only users with write or admin permissions to the repository "
     "can trigger Packit-as-a-Service"
@@ -56,6 +67,15 @@ ALLOWLIST_CONSTANTS = {
 
 CELERY_DEFAULT_QUEUE_NAME = "short-running"
 
+# package configs fetched from the forges are reused for this long (in seconds)
+PACKAGE_CONFIG_CACHE_TTL = 300
+PACKAGE_CONFIG_CACHE_SIZE = 512
+
+# details of finished Testing Farm requests are reused for repeated notifications
+TESTING_FARM_FINAL_STATES = ("complete", "error")
+TESTING_FARM_REQUEST_CACHE_TTL = 600
+TESTING_FARM_REQUEST_CACHE_SIZE = 128
+
 
 class KojiBuildState(Enum):
     """
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: MIT
 
 import hmac
-import json
 from hashlib import sha1
 from http import HTTPStatus
 from logging import getLogger
@@ -252,7 +251,8 @@ class GitlabWebhook(Resource):
             logger.warning(msg_failed_error)
             raise ValidationFailed(msg_failed_error)
 
-        project_data = json.loads(request.data)["project"]
+        # the body has been parsed already in post(), request.json reuses the result
+        project_data = request.json["project"]
         parsed_url = parse_git_repo(potential_url=project_data["http_url"])
         token_namespace = token_decoded["namespace"]
         token_repo_name = token_decoded["repo_name"]
@@ -4,7 +4,6 @@
 """
 This file defines classes for events which are sent by GitHub or FedMsg.
 """
-import copy
 import enum
 import logging
 from datetime import datetime, timezone
@@ -12,7 +11,7 @@ from typing import Dict, List, Optional, Union
 
 from ogr.abstract import GitProject
 from ogr.services.pagure import PagureProject
-from packit.config import PackageConfig, get_package_config_from_repo
+from packit.config import PackageConfig
 from packit_service.config import PackageConfigGetter, ServiceConfig
 from packit_service.constants import KojiBuildState
 from packit_service.models import (
@@ -37,6 +36,9 @@ from packit_service.service.db_triggers import (
 
 logger = logging.getLogger(__name__)
 
+# marks the lazy attributes which were not fetched yet
+_NOT_FETCHED = object()
+
 
 class PullRequestAction(enum.Enum):
     opened = "opened"
@@ -72,7 +74,23 @@ class FedmsgTopic(enum.Enum):
     pr_flag_added = "org.fedoraproject.prod.pagure.pull-request.flag.added"
 
 
+# Enum values used when serializing the events in get_dict,
+# a dictionary lookup is cheaper than accessing the Enum.value property
+_PR_ACTION_VALUE = {member: member.value for member in PullRequestAction}
+_GITLAB_ACTION_VALUE = {member: member.value for member in GitlabEventAction}
+_PR_COMMENT_ACTION_VALUE = {member: member.value for member in PullRequestCommentAction}
+_ISSUE_COMMENT_ACTION_VALUE = {member: member.value for member in IssueCommentAction}
+_PR_LABEL_ACTION_VALUE = {member: member.value for member in PullRequestLabelAction}
+_FEDMSG_TOPIC_VALUE = {member: member.value for member in FedmsgTopic}
+_TESTING_FARM_RESULT_VALUE = {member: member.value for member in TestingFarmResult}
+_ALLOWLIST_STATUS_VALUE = {member: member.value for member in AllowlistStatus}
+_KOJI_BUILD_STATE_VALUE = {member: member.value for member in KojiBuildState}
+
+
 class TestResult(dict):
+    # there is one instance per testcase, don't give each of them a __dict__ as well
+    __slots__ = ("name", "result", "log_url")
+
     def __init__(self, name: str, result: TestingFarmResult, log_url: str):
         dict.__init__(self, name=name, result=result, log_url=log_url)
         self.name = name
@@ -228,9 +246,7 @@ class EventData:
         return self._db_trigger
 
     def get_dict(self) -> dict:
-        d = self.__dict__
-        d = copy.deepcopy(d)
-        return d
+        return self.__dict__.copy()
 
     def get_project(self) -> Optional[GitProject]:
         if not self.project_url:
@@ -240,16 +256,48 @@ class EventData:
         )
 
 
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse the ISO 8601 time format used in the webhook payloads.
+
+    The most common format (e.g. '2021-04-21T10:20:30Z') is parsed directly,
+    the other ones are passed to datetime.fromisoformat.
+    """
+    if (
+        len(value) == 20
+        and value[-1] == "Z"
+        and value[4] == value[7] == "-"
+        and value[10] in "T "
+        and value[13] == value[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    # https://stackoverflow.com/questions/127803/how-do-i-parse-an-iso-8601-formatted-date/49784038
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 class Event:
     def __init__(self, created_at: Union[int, float, str] = None):
         self.created_at: datetime
+        # epoch seconds of created_at, kept when we get them so that get_dict
+        # does not need to convert the datetime back
+        self._created_at_epoch: Optional[int] = None
         if created_at:
             if isinstance(created_at, (int, float)):
                 self.created_at = datetime.fromtimestamp(created_at, timezone.utc)
+                self._created_at_epoch = int(created_at)
             elif isinstance(created_at, str):
-                # https://stackoverflow.com/questions/127803/how-do-i-parse-an-iso-8601-formatted-date/49784038
-                created_at = created_at.replace("Z", "+00:00")
-                self.created_at = datetime.fromisoformat(created_at)
+                self.created_at = parse_iso_datetime(created_at)
         else:
             self.created_at = datetime.now()
 
@@ -268,14 +316,22 @@ class Event:
         return event
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
-        d = default_dict or self.__dict__
-        d = copy.deepcopy(d)
+        # shallow copy is enough, the values are replaced (not modified) below
+        # and in the subclasses, mutable containers are copied there explicitly
+        d = (default_dict or self.__dict__).copy()
         # whole dict has to be JSON serializable because of redis
         d["event_type"] = self.__class__.__name__
-        d["trigger_id"] = self.db_trigger.id if self.db_trigger else None
-        d["created_at"] = int(d["created_at"].timestamp())
+        # db_trigger might need a database round-trip, get it only once
+        db_trigger = self.db_trigger
+        d["trigger_id"] = db_trigger.id if db_trigger else None
+        created_at_epoch = d.pop("_created_at_epoch", None)
+        d["created_at"] = (
+            created_at_epoch
+            if created_at_epoch is not None
+            else int(d["created_at"].timestamp())
+        )
         d["project_url"] = d.get("project_url") or (
-            self.db_trigger.project.project_url if self.db_trigger else None
+            db_trigger.project.project_url if db_trigger else None
         )
         return d
 
@@ -332,19 +388,20 @@ class AbstractForgeIndependentEvent(Event):
         self._pr_id = pr_id
 
         # Lazy properties
-        self._project: Optional[GitProject] = None
-        self._base_project: Optional[GitProject] = None
+        # (projects are fetched only once, even when there is none)
+        self._project: Union[GitProject, None, object] = _NOT_FETCHED
+        self._base_project: Union[GitProject, None, object] = _NOT_FETCHED
         self._package_config: Optional[PackageConfig] = None
 
     @property
     def project(self):
-        if not self._project:
+        if self._project is _NOT_FETCHED:
             self._project = self.get_project()
         return self._project
 
     @property
     def base_project(self):
-        if not self._base_project:
+        if self._base_project is _NOT_FETCHED:
             self._base_project = self.get_base_project()
         return self._base_project
 
@@ -528,7 +585,7 @@ class MergeRequestGitlabEvent(AddPullRequestDbTrigger, AbstractGitlabEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _GITLAB_ACTION_VALUE[result["action"]]
         return result
 
     def get_base_project(self) -> GitProject:
@@ -567,7 +624,7 @@ class PullRequestGithubEvent(AddPullRequestDbTrigger, AbstractGithubEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _PR_ACTION_VALUE[result["action"]]
         return result
 
     def get_base_project(self) -> Optional[GitProject]:
@@ -608,7 +665,7 @@ class MergeRequestCommentGitlabEvent(AddPullRequestDbTrigger, AbstractGitlabEven
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _GITLAB_ACTION_VALUE[result["action"]]
         return result
 
     def get_base_project(self) -> GitProject:
@@ -658,7 +715,7 @@ class PullRequestCommentGithubEvent(AddPullRequestDbTrigger, AbstractGithubEvent
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _PR_COMMENT_ACTION_VALUE[result["action"]]
         result["commit_sha"] = self.commit_sha
         return result
 
@@ -701,7 +758,7 @@ class IssueCommentGitlabEvent(AddIssueDbTrigger, AbstractGitlabEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _GITLAB_ACTION_VALUE[result["action"]]
         result["tag_name"] = self.tag_name
         result["issue_id"] = self.issue_id
         return result
@@ -749,7 +806,7 @@ class IssueCommentEvent(AddIssueDbTrigger, AbstractGithubEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _ISSUE_COMMENT_ACTION_VALUE[result["action"]]
         result["tag_name"] = self.tag_name
         result["issue_id"] = self.issue_id
         return result
@@ -799,7 +856,8 @@ class InstallationEvent(Event):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["status"] = result["status"].value
+        result["status"] = _ALLOWLIST_STATUS_VALUE[result["status"]]
+        result["repositories"] = list(result["repositories"])
         return result
 
     @property
@@ -846,14 +904,14 @@ class DistGitCommitEvent(AbstractForgeIndependentEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["topic"] = result["topic"].value
+        result["topic"] = _FEDMSG_TOPIC_VALUE[result["topic"]]
         result.pop("_db_trigger")
         return result
 
     @property
     def package_config(self):
         if not self._package_config:
-            self._package_config = get_package_config_from_repo(
+            self._package_config = PackageConfigGetter.fetch_package_config(
                 self.project, self.branch
             )
         return self._package_config
@@ -907,7 +965,8 @@ class TestingFarmResultsEvent(AbstractForgeIndependentEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["result"] = result["result"].value
+        result["result"] = _TESTING_FARM_RESULT_VALUE[result["result"]]
+        result["tests"] = list(result["tests"])
         result["pr_id"] = self.pr_id
         result.pop("_db_trigger")
         return result
@@ -1046,8 +1105,8 @@ class KojiBuildEvent(AbstractForgeIndependentEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["state"] = result["state"].value
-        result["old_state"] = result["old_state"].value
+        result["state"] = _KOJI_BUILD_STATE_VALUE[result["state"]]
+        result["old_state"] = _KOJI_BUILD_STATE_VALUE[result["old_state"]]
         result["commit_sha"] = self.commit_sha
         result["pr_id"] = self.pr_id
         result["git_ref"] = self.git_ref
@@ -1098,7 +1157,6 @@ class AbstractCoprBuildEvent(AbstractForgeIndependentEvent):
         git_ref = self.commit_sha  # ref should be name of the branch, not a hash
         self.topic = FedmsgTopic(topic)
 
-        trigger_db = build.get_trigger_object()
         pr_id = None
         if trigger_db.job_trigger_model_type == JobTriggerModelType.pull_request:
             pr_id = trigger_db.pr_id  # type: ignore
@@ -1121,10 +1179,11 @@ class AbstractCoprBuildEvent(AbstractForgeIndependentEvent):
         self.project_name = project_name
         self.pkg = pkg
         self.timestamp = timestamp
+        self._db_trigger: Optional[AbstractTriggerDbType] = trigger_db
 
     @property
     def db_trigger(self) -> Optional[AbstractTriggerDbType]:
-        return self.build.get_trigger_object()
+        return self._db_trigger
 
     def get_base_project(self) -> Optional[GitProject]:
         if self.pr_id is not None:
@@ -1184,8 +1243,9 @@ class AbstractCoprBuildEvent(AbstractForgeIndependentEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["topic"] = result["topic"].value
+        result["topic"] = _FEDMSG_TOPIC_VALUE[result["topic"]]
         result.pop("build")
+        result.pop("_db_trigger")
         return result
 
     def get_copr_build_url(self) -> str:
@@ -1267,7 +1327,7 @@ class PullRequestCommentPagureEvent(AddPullRequestDbTrigger, AbstractPagureEvent
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _PR_COMMENT_ACTION_VALUE[result["action"]]
         return result
 
     def get_base_project(self) -> GitProject:
@@ -1310,7 +1370,7 @@ class PullRequestPagureEvent(AddPullRequestDbTrigger, AbstractPagureEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _PR_ACTION_VALUE[result["action"]]
         return result
 
     def get_base_project(self) -> GitProject:
@@ -1350,7 +1410,8 @@ class PullRequestLabelPagureEvent(AddPullRequestDbTrigger, AbstractPagureEvent):
 
     def get_dict(self, default_dict: Optional[Dict] = None) -> dict:
         result = super().get_dict()
-        result["action"] = result["action"].value
+        result["action"] = _PR_LABEL_ACTION_VALUE[result["action"]]
+        result["labels"] = list(result["labels"])
         return result
 
     def get_base_project(self) -> GitProject:
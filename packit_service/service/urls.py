@@ -1,9 +1,19 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from functools import lru_cache
+
 from packit_service.config import ServiceConfig
 
-DASHBOARD_URL = ServiceConfig().get_service_config().dashboard_url
+
+@lru_cache(maxsize=1)
+def _get_dashboard_url() -> str:
+    """
+    Dashboard URL from the service config.
+
+    Loaded on the first use, not on import, use `cache_clear()` to reload it.
+    """
+    return ServiceConfig.get_service_config().dashboard_url
 
 
 def _get_url_for_dashboard_results(job_type: str, id_: int) -> str:
@@ -20,7 +30,7 @@ def _get_url_for_dashboard_results(job_type: str, id_: int) -> str:
     Returns:
         URL to the results of `id_` entry of type `type`.
     """
-    return f"{DASHBOARD_URL}/results/{job_type}/{id_}"
+    return f"{_get_dashboard_url()}/results/{job_type}/{id_}"
 
 
 def get_srpm_build_info_url(id_: int) -> str:
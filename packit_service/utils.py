@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Any, Hashable, Optional, Tuple
 
 from packit.config import JobConfig, PackageConfig
 from packit.schema import JobConfigSchema, PackageConfigSchema
@@ -33,6 +36,56 @@ class only_once(object):
         return self.func(*args, **kwargs)
 
 
+class TimedLRUCache:
+    """
+    Mapping with a limited size which forgets the least recently used items
+    and the items which are older than `ttl` seconds.
+
+    Safe to be shared by threads, even reading reorders or removes the items.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get_item(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def _get_item(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        # needs to be called with the lock held
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if time.monotonic() - item[0] > self.ttl:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return item
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._get_item(key)
+        return default if item is None else item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
 # wrappers for dumping/loading of configs
 def load_package_config(package_config: PackageConfig):
     return PackageConfigSchema().load(package_config) if package_config else None
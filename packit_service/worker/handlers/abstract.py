@@ -311,12 +311,18 @@ class JobHandler(Handler):
         return job_results
 
     @classmethod
-    def get_signature(cls, event: Event, job: Optional[JobConfig]) -> Signature:
+    def get_signature(
+        cls,
+        event: Event,
+        job: Optional[JobConfig],
+        event_dict: Optional[dict] = None,
+    ) -> Signature:
         """
         Get the signature of a Celery task which will run the handler.
         https://docs.celeryproject.org/en/stable/userguide/canvas.html#signatures
         :param event: event which triggered the task
         :param job: job to process
+        :param event_dict: already serialized event, if the caller has it
         """
         logger.debug(f"Getting signature of a Celery task {cls.task_name}.")
         return signature(
@@ -324,7 +330,7 @@ class JobHandler(Handler):
             kwargs={
                 "package_config": dump_package_config(event.package_config),
                 "job_config": dump_job_config(job),
-                "event": event.get_dict(),
+                "event": event.get_dict() if event_dict is None else event_dict,
             },
         )
 
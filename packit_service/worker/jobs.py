@@ -49,6 +49,14 @@ from packit_service.worker.allowlist import Allowlist
 
 REQUESTED_PULL_REQUEST_COMMENT = "/packit"
 
+COMMENT_EVENTS = (
+    PullRequestCommentGithubEvent,
+    PullRequestCommentPagureEvent,
+    IssueCommentEvent,
+    MergeRequestCommentGitlabEvent,
+    IssueCommentGitlabEvent,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,16 +86,7 @@ def get_handlers_for_event(
         ):
             jobs_matching_trigger.append(job)
 
-    if isinstance(
-        event,
-        (
-            PullRequestCommentGithubEvent,
-            PullRequestCommentPagureEvent,
-            IssueCommentEvent,
-            MergeRequestCommentGitlabEvent,
-            IssueCommentGitlabEvent,
-        ),
-    ):
+    if isinstance(event, COMMENT_EVENTS):
         handlers_triggered_by_comment = get_handlers_for_comment(event.comment)
     else:
         handlers_triggered_by_comment = None
@@ -119,6 +118,10 @@ def get_packit_commands_from_comment(comment: str) -> List[str]:
         logger.debug("Empty comment, nothing to do.")
         return []
 
+    # most of the comments are not meant for us, don't go through them line by line
+    if REQUESTED_PULL_REQUEST_COMMENT not in comment_parts:
+        return []
+
     comment_lines = comment_parts.split("\n")
 
     for line in filter(None, map(str.strip, comment_lines)):
@@ -137,7 +140,8 @@ def get_handlers_for_comment(comment: str) -> Set[Type[JobHandler]]:
     if not commands:
         return set()
 
-    handlers = MAP_COMMENT_TO_HANDLER[commands[0]]
+    # .get() to not add an empty entry to the defaultdict for every unknown command
+    handlers = MAP_COMMENT_TO_HANDLER.get(commands[0], set())
     if not handlers:
         logger.debug(f"Command {commands[0]} not supported by packit.")
     return handlers
@@ -225,13 +229,17 @@ class SteveJobs:
         handler_classes = get_handlers_for_event(event, event.package_config)
 
         if not handler_classes:
+            # lazy formatting, str(event) serializes the whole event
             logger.debug(
-                f"There is no handler for {event} event suitable for the configuration."
+                "There is no handler for %s event suitable for the configuration.",
+                event,
             )
             return []
 
         allowlist = Allowlist()
         processing_results: List[TaskResults] = []
+        # serialize the event only once, it is the same for all the handlers
+        event_dict = event.get_dict()
 
         for handler_kls in handler_classes:
             # TODO: merge to to get_handlers_for_event so
@@ -258,6 +266,7 @@ class SteveJobs:
                             msg="Account is not allowlisted!",
                             job_config=job_config,
                             event=event,
+                            event_dict=event_dict,
                         )
                     )
                 return processing_results
@@ -269,7 +278,7 @@ class SteveJobs:
                 handler = handler_kls(
                     package_config=event.package_config,
                     job_config=job_config,
-                    event=event.get_dict(),
+                    event=dict(event_dict),
                 )
                 if not handler.pre_check():
                     continue
@@ -284,7 +293,7 @@ class SteveJobs:
                         service_config=self.service_config,
                         package_config=event.package_config,
                         project=event.project,
-                        metadata=EventData.from_event_dict(event.get_dict()),
+                        metadata=EventData.from_event_dict(dict(event_dict)),
                         db_trigger=event.db_trigger,
                         job_config=job_config,
                     )
@@ -295,7 +304,9 @@ class SteveJobs:
                         url="",
                     )
                 signatures.append(
-                    handler_kls.get_signature(event=event, job=job_config)
+                    handler_kls.get_signature(
+                        event=event, job=job_config, event_dict=event_dict
+                    )
                 )
                 processing_results.append(
                     TaskResults.create_from(
@@ -303,6 +314,7 @@ class SteveJobs:
                         msg="Job created.",
                         job_config=job_config,
                         event=event,
+                        event_dict=event_dict,
                     )
                 )
             # https://docs.celeryproject.org/en/stable/userguide/canvas.html#groups
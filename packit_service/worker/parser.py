@@ -5,17 +5,22 @@
 Parser is transforming github JSONs into `events` objects
 """
 import logging
-from functools import partial
-from typing import Dict, Optional, Type, Union, List
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union, List
+from xml.etree import ElementTree
 
-import xmltodict
-from ogr.parsing import parse_git_repo
+from ogr.parsing import RepoUrl, parse_git_repo
 from packit.utils import nested_get
 
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     KojiBuildState,
+    TESTING_FARM_FINAL_STATES,
     TESTING_FARM_INSTALLABILITY_TEST_URL,
+    TESTING_FARM_REQUEST_CACHE_SIZE,
+    TESTING_FARM_REQUEST_CACHE_TTL,
 )
 from packit_service.models import TestingFarmResult, TFTTestRunModel
 from packit_service.service.events import (
@@ -23,6 +28,7 @@ from packit_service.service.events import (
     CoprBuildEndEvent,
     AbstractCoprBuildEvent,
     CoprBuildStartEvent,
+    FedmsgTopic,
     DistGitCommitEvent,
     GitlabEventAction,
     InstallationEvent,
@@ -47,6 +53,7 @@ from packit_service.service.events import (
     TestingFarmResultsEvent,
     TestResult,
 )
+from packit_service.utils import TimedLRUCache
 from packit_service.worker.handlers import (
     DistGitCommitHandler,
 )
@@ -54,6 +61,41 @@ from packit_service.worker.testing_farm import TestingFarmJobHelper
 
 logger = logging.getLogger(__name__)
 
+# member maps of the action enums, indexing them directly skips EnumMeta.__getitem__
+# (the set literals used in the membership tests are already compiled to constants)
+GITLAB_ACTIONS = GitlabEventAction.__members__
+PR_ACTIONS = PullRequestAction.__members__
+PR_COMMENT_ACTIONS = PullRequestCommentAction.__members__
+ISSUE_COMMENT_ACTIONS = IssueCommentAction.__members__
+
+# value -> member maps, the same lookups Enum(value) does via EnumMeta.__call__
+KOJI_BUILD_STATES = {state.value: state for state in KojiBuildState}
+TESTING_FARM_RESULTS = {result.value: result for result in TestingFarmResult}
+
+PACKIT_BOT_LOGINS = frozenset(
+    {"packit-as-a-service[bot]", "packit-as-a-service-stg[bot]"}
+)
+
+COPR_BUILD_EVENTS: Dict[str, Type[AbstractCoprBuildEvent]] = {
+    FedmsgTopic.copr_build_started.value: CoprBuildStartEvent,
+    FedmsgTopic.copr_build_finished.value: CoprBuildEndEvent,
+}
+KOJI_TASK_STATE_TOPIC = "org.fedoraproject.prod.buildsys.task.state.change"
+
+# "refs/heads/" or "refs/tags/" prefix of a git ref, the rest may contain slashes
+REF_PREFIX_RE = re.compile(r"^refs/[^/]+/")
+
+
+@lru_cache(maxsize=2048)
+def parse_project_url(url: str) -> Optional[RepoUrl]:
+    """
+    Parse the project URL from the webhook.
+
+    Events for the same project come repeatedly, so the results are cached.
+    Treat the returned object as read-only, it is shared between the calls.
+    """
+    return parse_git_repo(potential_url=url)
+
 
 class Parser:
     """
@@ -61,6 +103,11 @@ class Parser:
     to have method inside the `Parser` class to create objects defined in `events.py`.
     """
 
+    # request id -> details of a finished Testing Farm request
+    tf_request_details_cache = TimedLRUCache(
+        maxsize=TESTING_FARM_REQUEST_CACHE_SIZE, ttl=TESTING_FARM_REQUEST_CACHE_TTL
+    )
+
     @staticmethod
     def parse_event(
         event: dict,
@@ -93,23 +140,7 @@ class Parser:
             return None
 
         for response in map(
-            lambda parser: parser(event),
-            (
-                Parser.parse_pr_event,
-                Parser.parse_pull_request_comment_event,
-                Parser.parse_issue_comment_event,
-                Parser.parse_release_event,
-                Parser.parse_push_event,
-                Parser.parse_installation_event,
-                Parser.parse_distgit_commit_event,
-                Parser.parse_testing_farm_results_event,
-                Parser.parse_copr_event,
-                Parser.parse_mr_event,
-                Parser.parse_koji_event,
-                Parser.parse_merge_request_comment_event,
-                Parser.parse_gitlab_issue_comment_event,
-                Parser.parse_gitlab_push_event,
-            ),
+            lambda parser: parser(event), Parser.get_parsers_for_event(event)
         ):
             if response:
                 return response
@@ -117,16 +148,84 @@ class Parser:
         logger.debug("We don't process this event.")
         return None
 
+    @staticmethod
+    def get_parsers_for_event(event: dict) -> Tuple[Callable[[dict], Any], ...]:
+        """
+        Pick the parsers that can match the event by its top-level keys
+        so that we don't need to try all of them in turn.
+
+        Fedora messages are recognized by their topic, Testing Farm notifications
+        by their source, GitLab webhooks by their object kind and GitHub webhooks
+        by the keys specific to their type. Anything else (e.g. GitHub App
+        installations) goes through all the parsers.
+
+        :param event: JSON from GitHub, GitLab, Testing Farm or fedmsg
+        :return: parsers to try, in the order of their priority
+        """
+        topic = event.get("topic")
+        if topic == DistGitCommitHandler.topic:
+            return (Parser.parse_distgit_commit_event,)
+        if topic in COPR_BUILD_EVENTS:
+            return (Parser.parse_copr_event,)
+        if topic == KOJI_TASK_STATE_TOPIC:
+            return (Parser.parse_koji_event,)
+
+        if event.get("source") == "testing-farm":
+            return (Parser.parse_testing_farm_results_event,)
+
+        object_kind = event.get("object_kind")
+        if object_kind == "merge_request":
+            return (Parser.parse_mr_event,)
+        if object_kind == "note":
+            return (
+                Parser.parse_merge_request_comment_event,
+                Parser.parse_gitlab_issue_comment_event,
+            )
+        if object_kind == "push":
+            return (Parser.parse_gitlab_push_event,)
+
+        # GitHub doesn't send the event type in the payload (only in a header),
+        # but the top-level keys of the most common webhooks tell it
+        if "pull_request" in event:
+            return (Parser.parse_pr_event,)
+        if "issue" in event and "comment" in event:
+            return (
+                Parser.parse_pull_request_comment_event,
+                Parser.parse_issue_comment_event,
+            )
+        if "release" in event:
+            return (Parser.parse_release_event,)
+        if "pusher" in event:
+            return (Parser.parse_push_event,)
+
+        return (
+            Parser.parse_pr_event,
+            Parser.parse_pull_request_comment_event,
+            Parser.parse_issue_comment_event,
+            Parser.parse_release_event,
+            Parser.parse_push_event,
+            Parser.parse_installation_event,
+            Parser.parse_distgit_commit_event,
+            Parser.parse_testing_farm_results_event,
+            Parser.parse_copr_event,
+            Parser.parse_mr_event,
+            Parser.parse_koji_event,
+            Parser.parse_merge_request_comment_event,
+            Parser.parse_gitlab_issue_comment_event,
+            Parser.parse_gitlab_push_event,
+        )
+
     @staticmethod
     def parse_mr_event(event) -> Optional[MergeRequestGitlabEvent]:
         """Look into the provided event and see if it's one for a new gitlab MR."""
         if event.get("object_kind") != "merge_request":
             return None
 
-        state = event["object_attributes"]["state"]
+        object_attributes = event["object_attributes"]
+        state = object_attributes["state"]
         if state != "opened":
             return None
-        action = nested_get(event, "object_attributes", "action")
+        action = object_attributes.get("action")
         if action not in {"reopen", "update"}:
             action = state
 
@@ -135,44 +234,44 @@ class Parser:
             logger.warning("No Gitlab username from event.")
             return None
 
-        object_id = event["object_attributes"]["id"]
+        object_id = object_attributes["id"]
         if not object_id:
             logger.warning("No object id from the event.")
             return None
 
-        object_iid = event["object_attributes"]["iid"]
+        object_iid = object_attributes["iid"]
         if not object_iid:
             logger.warning("No object iid from the event.")
             return None
 
-        source_project_url = nested_get(event, "object_attributes", "source", "web_url")
+        source_project_url = nested_get(object_attributes, "source", "web_url")
         if not source_project_url:
             logger.warning("Source project url not found in the event.")
             return None
-        parsed_source_url = parse_git_repo(potential_url=source_project_url)
+        parsed_source_url = parse_project_url(source_project_url)
         logger.info(
-            f"Source: "
-            f"repo={parsed_source_url.repo} "
-            f"namespace={parsed_source_url.namespace} "
-            f"url={source_project_url}."
+            "Source: repo=%s namespace=%s url=%s.",
+            parsed_source_url.repo,
+            parsed_source_url.namespace,
+            source_project_url,
         )
 
         target_project_url = nested_get(event, "project", "web_url")
         if not target_project_url:
             logger.warning("Target project url not found in the event.")
             return None
-        parsed_target_url = parse_git_repo(potential_url=target_project_url)
+        parsed_target_url = parse_project_url(target_project_url)
         logger.info(
-            f"Target: "
-            f"repo={parsed_target_url.repo} "
-            f"namespace={parsed_target_url.namespace} "
-            f"url={target_project_url}."
+            "Target: repo=%s namespace=%s url=%s.",
+            parsed_target_url.repo,
+            parsed_target_url.namespace,
+            target_project_url,
         )
 
-        commit_sha = nested_get(event, "object_attributes", "last_commit", "id")
+        commit_sha = nested_get(object_attributes, "last_commit", "id")
 
         return MergeRequestGitlabEvent(
-            action=GitlabEventAction[action],
+            action=GITLAB_ACTIONS[action],
             username=username,
             object_id=object_id,
             object_iid=object_iid,
@@ -187,7 +286,8 @@ class Parser:
     @staticmethod
     def parse_pr_event(event) -> Optional[PullRequestGithubEvent]:
         """Look into the provided event and see if it's one for a new github PR."""
-        if not event.get("pull_request"):
+        pull_request = event.get("pull_request")
+        if not pull_request:
             return None
 
         pr_id = event.get("number")
@@ -195,40 +295,38 @@ class Parser:
         if action not in {"opened", "reopened", "synchronize"} or not pr_id:
             return None
 
-        logger.info(f"GitHub PR#{pr_id} {action!r} event.")
+        logger.info("GitHub PR#%s %r event.", pr_id, action)
 
         # we can't use head repo here b/c the app is set up against the upstream repo
         # and not the fork, on the other hand, we don't process packit.yaml from
         # the PR but what's in the upstream
-        base_repo_namespace = nested_get(
-            event, "pull_request", "head", "repo", "owner", "login"
-        )
-        base_repo_name = nested_get(event, "pull_request", "head", "repo", "name")
+        head = pull_request.get("head") or {}
+        head_repo = head.get("repo") or {}
+        base_repo_namespace = nested_get(head_repo, "owner", "login")
+        base_repo_name = head_repo.get("name")
 
         if not (base_repo_name and base_repo_namespace):
             logger.warning("No full name of the repository.")
             return None
 
-        base_ref = nested_get(event, "pull_request", "head", "sha")
+        base_ref = head.get("sha")
         if not base_ref:
             logger.warning("Ref where the PR is coming from is not set.")
             return None
 
-        user_login = nested_get(event, "pull_request", "user", "login")
+        user_login = nested_get(pull_request, "user", "login")
         if not user_login:
             logger.warning("No GitHub login name from event.")
             return None
 
-        target_repo_namespace = nested_get(
-            event, "pull_request", "base", "repo", "owner", "login"
-        )
-        target_repo_name = nested_get(event, "pull_request", "base", "repo", "name")
-        logger.info(f"Target repo: {target_repo_namespace}/{target_repo_name}.")
+        target_repo = nested_get(pull_request, "base", "repo") or {}
+        target_repo_namespace = nested_get(target_repo, "owner", "login")
+        target_repo_name = target_repo.get("name")
+        logger.info("Target repo: %s/%s.", target_repo_namespace, target_repo_name)
 
-        commit_sha = nested_get(event, "pull_request", "head", "sha")
         https_url = event["repository"]["html_url"]
         return PullRequestGithubEvent(
-            action=PullRequestAction[action],
+            action=PR_ACTIONS[action],
             pr_id=pr_id,
             base_repo_namespace=base_repo_namespace,
             base_repo_name=base_repo_name,
@@ -236,7 +334,7 @@ class Parser:
             target_repo_namespace=target_repo_namespace,
             target_repo_name=target_repo_name,
             project_url=https_url,
-            commit_sha=commit_sha,
+            commit_sha=base_ref,
             user_login=user_login,
         )
 
@@ -260,7 +358,7 @@ class Parser:
             return None
         elif event.get("after").startswith("0000000"):
             logger.info(
-                f"GitLab push event on '{raw_ref}' by {pusher} to delete branch"
+                "GitLab push event on '%s' by %s to delete branch", raw_ref, pusher
             )
             return None
 
@@ -269,34 +367,36 @@ class Parser:
         if not number_of_commits:
             logger.warning("No number of commits info from event.")
 
-        raw_ref = raw_ref.split("/", maxsplit=2)
+        ref = REF_PREFIX_RE.sub("", raw_ref, count=1)
 
-        if not raw_ref:
+        if not ref:
             logger.warning("No ref info from event.")
 
-        ref = raw_ref[-1]
-
         head_commit = commits[-1]["id"]
 
-        if not raw_ref:
+        if not head_commit:
             logger.warning("No commit_id info from event.")
 
         logger.info(
-            f"Gitlab push event on '{raw_ref}': {before[:8]} -> {head_commit[:8]} "
-            f"by {pusher} "
-            f"({number_of_commits} {'commit' if number_of_commits == 1 else 'commits'})"
+            "Gitlab push event on '%s': %s -> %s by %s (%s %s)",
+            raw_ref,
+            before[:8],
+            head_commit[:8],
+            pusher,
+            number_of_commits,
+            "commit" if number_of_commits == 1 else "commits",
         )
 
         project_url = nested_get(event, "project", "web_url")
         if not project_url:
             logger.warning("Target project url not found in the event.")
             return None
-        parsed_url = parse_git_repo(potential_url=project_url)
+        parsed_url = parse_project_url(project_url)
         logger.info(
-            f"Project: "
-            f"repo={parsed_url.repo} "
-            f"namespace={parsed_url.namespace} "
-            f"url={project_url}."
+            "Project: repo=%s namespace=%s url=%s.",
+            parsed_url.repo,
+            parsed_url.namespace,
+            project_url,
         )
 
         return PushGitlabEvent(
@@ -327,7 +427,7 @@ class Parser:
             return None
         elif event.get("deleted"):
             logger.info(
-                f"GitHub push event on '{raw_ref}' by {pusher} to delete branch"
+                "GitHub push event on '%s' by %s to delete branch", raw_ref, pusher
             )
             return None
 
@@ -335,12 +435,16 @@ class Parser:
         if number_of_commits is None and "commits" in event:
             number_of_commits = len(event.get("commits"))
 
-        ref = raw_ref.split("/", maxsplit=2)[-1]
+        ref = REF_PREFIX_RE.sub("", raw_ref, count=1)
 
         logger.info(
-            f"GitHub push event on '{raw_ref}': {before[:8]} -> {head_commit[:8]} "
-            f"by {pusher} "
-            f"({number_of_commits} {'commit' if number_of_commits == 1 else 'commits'})"
+            "GitHub push event on '%s': %s -> %s by %s (%s %s)",
+            raw_ref,
+            before[:8],
+            head_commit[:8],
+            pusher,
+            number_of_commits,
+            "commit" if number_of_commits == 1 else "commits",
         )
 
         repo_namespace = nested_get(event, "repository", "owner", "login")
@@ -372,7 +476,7 @@ class Parser:
         if action != "created" or not issue_id or not comment:
             return None
 
-        logger.info(f"Github issue#{issue_id} comment: {comment!r} {action!r} event.")
+        logger.info("Github issue#%s comment: %r %r event.", issue_id, comment, action)
 
         base_repo_namespace = nested_get(event, "repository", "owner", "login")
         base_repo_name = nested_get(event, "repository", "name")
@@ -385,10 +489,10 @@ class Parser:
             return None
 
         target_repo = nested_get(event, "repository", "full_name")
-        logger.info(f"Target repo: {target_repo}.")
+        logger.info("Target repo: %s.", target_repo)
         https_url = nested_get(event, "repository", "html_url")
         return IssueCommentEvent(
-            IssueCommentAction[action],
+            ISSUE_COMMENT_ACTIONS[action],
             issue_id,
             base_repo_namespace,
             base_repo_name,
@@ -408,39 +512,40 @@ class Parser:
         if not issue:
             return None
 
-        issue_id = nested_get(event, "issue", "iid")
+        issue_id = issue.get("iid")
         if not issue_id:
             logger.warning("No issue id from the event.")
             return None
-        comment = nested_get(event, "object_attributes", "note")
+        object_attributes = event.get("object_attributes") or {}
+        comment = object_attributes.get("note")
         if not comment:
             logger.warning("No note from the event.")
             return None
 
-        state = nested_get(event, "issue", "state")
+        state = issue.get("state")
         if not state:
             logger.warning("No state from the event.")
             return None
         if state != "opened":
             return None
-        action = nested_get(event, "object_attributes", "action")
+        action = object_attributes.get("action")
         if action not in {"reopen", "update"}:
             action = state
 
         logger.info(
-            f"Gitlab issue ID: {issue_id} comment: {comment!r} {action!r} event."
+            "Gitlab issue ID: %s comment: %r %r event.", issue_id, comment, action
         )
 
         project_url = nested_get(event, "project", "web_url")
         if not project_url:
             logger.warning("Target project url not found in the event.")
             return None
-        parsed_url = parse_git_repo(potential_url=project_url)
+        parsed_url = parse_project_url(project_url)
         logger.info(
-            f"Project: "
-            f"repo={parsed_url.repo} "
-            f"namespace={parsed_url.namespace} "
-            f"url={project_url}."
+            "Project: repo=%s namespace=%s url=%s.",
+            parsed_url.repo,
+            parsed_url.namespace,
+            project_url,
         )
 
         username = nested_get(event, "user", "username")
@@ -449,7 +554,7 @@ class Parser:
             return None
 
         return IssueCommentGitlabEvent(
-            action=GitlabEventAction[action],
+            action=GITLAB_ACTIONS[action],
             issue_id=issue_id,
             repo_namespace=parsed_url.namespace,
             repo_name=parsed_url.repo,
@@ -470,49 +575,53 @@ class Parser:
         if not merge_request:
             return None
 
-        state = nested_get(event, "merge_request", "state")
+        state = merge_request.get("state")
         if state != "opened":
             return None
 
-        action = nested_get(event, "merge_request", "action")
+        action = merge_request.get("action")
         if action not in {"reopen", "update"}:
             action = state
 
-        object_iid = nested_get(event, "merge_request", "iid")
+        object_iid = merge_request.get("iid")
         if not object_iid:
             logger.warning("No object iid from the event.")
 
-        object_id = nested_get(event, "merge_request", "id")
+        object_id = merge_request.get("id")
         if not object_id:
             logger.warning("No object id from the event.")
 
         comment = nested_get(event, "object_attributes", "note")
         logger.info(
-            f"Gitlab MR id#{object_id} iid#{object_iid} comment: {comment!r} {action!r} event."
+            "Gitlab MR id#%s iid#%s comment: %r %r event.",
+            object_id,
+            object_iid,
+            comment,
+            action,
         )
 
-        source_project_url = nested_get(event, "merge_request", "source", "web_url")
+        source_project_url = nested_get(merge_request, "source", "web_url")
         if not source_project_url:
             logger.warning("Source project url not found in the event.")
             return None
-        parsed_source_url = parse_git_repo(potential_url=source_project_url)
+        parsed_source_url = parse_project_url(source_project_url)
         logger.info(
-            f"Source: "
-            f"repo={parsed_source_url.repo} "
-            f"namespace={parsed_source_url.namespace} "
-            f"url={source_project_url}."
+            "Source: repo=%s namespace=%s url=%s.",
+            parsed_source_url.repo,
+            parsed_source_url.namespace,
+            source_project_url,
         )
 
         target_project_url = nested_get(event, "project", "web_url")
         if not target_project_url:
             logger.warning("Target project url not found in the event.")
             return None
-        parsed_target_url = parse_git_repo(potential_url=target_project_url)
+        parsed_target_url = parse_project_url(target_project_url)
         logger.info(
-            f"Target: "
-            f"repo={parsed_target_url.repo} "
-            f"namespace={parsed_target_url.namespace} "
-            f"url={target_project_url}."
+            "Target: repo=%s namespace=%s url=%s.",
+            parsed_target_url.repo,
+            parsed_target_url.namespace,
+            target_project_url,
         )
 
         username = nested_get(event, "user", "username")
@@ -520,13 +629,13 @@ class Parser:
             logger.warning("No Gitlab username from event.")
             return None
 
-        commit_sha = nested_get(event, "merge_request", "last_commit", "id")
+        commit_sha = nested_get(merge_request, "last_commit", "id")
         if not commit_sha:
             logger.warning("No commit_sha from the event.")
             return None
 
         return MergeRequestCommentGitlabEvent(
-            action=GitlabEventAction[action],
+            action=GITLAB_ACTIONS[action],
             object_id=object_id,
             object_iid=object_iid,
             source_repo_namespace=parsed_source_url.namespace,
@@ -552,8 +661,17 @@ class Parser:
         if action not in {"created", "edited"} or not pr_id:
             return None
 
+        # every status comment we post comes back as a webhook, drop those first
+        user_login = nested_get(event, "comment", "user", "login")
+        if not user_login:
+            logger.warning("No GitHub login name from event.")
+            return None
+        if user_login in PACKIT_BOT_LOGINS:
+            logger.debug("Our own comment.")
+            return None
+
         comment = nested_get(event, "comment", "body")
-        logger.info(f"Github PR#{pr_id} comment: {comment!r} {action!r} event.")
+        logger.info("Github PR#%s comment: %r %r event.", pr_id, comment, action)
 
         base_repo_namespace = nested_get(event, "issue", "user", "login")
         base_repo_name = nested_get(event, "repository", "name")
@@ -561,21 +679,13 @@ class Parser:
             logger.warning("No full name of the repository.")
             return None
 
-        user_login = nested_get(event, "comment", "user", "login")
-        if not user_login:
-            logger.warning("No GitHub login name from event.")
-            return None
-        if user_login in {"packit-as-a-service[bot]", "packit-as-a-service-stg[bot]"}:
-            logger.debug("Our own comment.")
-            return None
-
         target_repo_namespace = nested_get(event, "repository", "owner", "login")
         target_repo_name = nested_get(event, "repository", "name")
 
-        logger.info(f"Target repo: {target_repo_namespace}/{target_repo_name}.")
+        logger.info("Target repo: %s/%s.", target_repo_namespace, target_repo_name)
         https_url = event["repository"]["html_url"]
         return PullRequestCommentGithubEvent(
-            action=PullRequestCommentAction[action],
+            action=PR_COMMENT_ACTIONS[action],
             pr_id=pr_id,
             base_repo_namespace=base_repo_namespace,
             base_repo_name=None,
@@ -604,10 +714,12 @@ class Parser:
         repositories = event.get("repositories") or event.get("repositories_added", [])
         repo_names = [repo["full_name"] for repo in repositories]
 
-        logger.info(f"Github App installation {action!r} event. id: {installation_id}")
+        logger.info("Github App installation %r event. id: %s", action, installation_id)
         logger.debug(
-            f"account: {event['installation']['account']}, "
-            f"repositories: {repo_names}, sender: {event['sender']}"
+            "account: %s, repositories: %s, sender: %s",
+            event["installation"]["account"],
+            repo_names,
+            event["sender"],
         )
 
         # namespace (user/organization) into which the app has been installed
@@ -647,7 +759,7 @@ class Parser:
         if action != "published" or not release:
             return None
 
-        logger.info(f"GitHub release {release} {action!r} event.")
+        logger.info("GitHub release %s %r event.", release, action)
 
         repo_namespace = nested_get(event, "repository", "owner", "login")
         repo_name = nested_get(event, "repository", "name")
@@ -661,7 +773,10 @@ class Parser:
             return None
 
         logger.info(
-            f"New release event {release_ref!r} for repo {repo_namespace}/{repo_name}."
+            "New release event %r for repo %s/%s.",
+            release_ref,
+            repo_namespace,
+            repo_name,
         )
         https_url = event["repository"]["html_url"]
         return ReleaseEvent(repo_namespace, repo_name, release_ref, https_url)
@@ -673,7 +788,7 @@ class Parser:
         if topic != DistGitCommitHandler.topic:
             return None
 
-        logger.info(f"Dist-git commit event, topic: {topic}")
+        logger.info("Dist-git commit event, topic: %s", topic)
 
         dg_repo_namespace = nested_get(event, "commit", "namespace")
         dg_repo_name = nested_get(event, "commit", "repo")
@@ -689,8 +804,11 @@ class Parser:
             return None
 
         logger.info(
-            f"New commits added to dist-git repo {dg_repo_namespace}/{dg_repo_name},"
-            f"rev: {dg_rev}, branch: {dg_branch}"
+            "New commits added to dist-git repo %s/%s, rev: %s, branch: %s",
+            dg_repo_namespace,
+            dg_repo_name,
+            dg_rev,
+            dg_branch,
         )
 
         project_to_sync = ServiceConfig.get_service_config().get_project_to_sync(
@@ -728,24 +846,34 @@ class Parser:
         """Parse event["result"]["xunit"] to get tests results"""
         if not xunit:
             return []
-        xunit_dict = xmltodict.parse(xunit)
-        testcases = nested_get(
-            xunit_dict, "testsuites", "testsuite", "testcase", default=[]
-        )
         try:
-            return [
-                TestResult(
-                    name=testcase["@name"],
-                    result=TestingFarmResult(testcase["@result"]),
-                    log_url=nested_get(testcase, "logs", "log", 1, "@href", default=""),
-                )
-                for testcase in testcases
-            ]
-        except TypeError:
-            # packit-service/issues/967
-            logger.warning(f"Wrongly parsed TF result xunit: {xunit!r} -> {xunit_dict}")
+            xunit_root = ElementTree.fromstring(xunit)
+        except ElementTree.ParseError as ex:
+            logger.warning("Wrongly formatted TF result xunit: %r (%s)", xunit, ex)
             # We don't need it in most cases, so let's just continue instead of raising
             return []
+        if xunit_root.tag != "testsuites":
+            return []
+        results = []
+        # unlike with xmltodict, a single testcase is found the same way as more of them
+        # (it used to come as a dict instead of a list, packit-service/issues/967)
+        for testcase in xunit_root.iterfind("testsuite/testcase"):
+            name = testcase.get("name")
+            result = TESTING_FARM_RESULTS.get(testcase.get("result"))
+            if not result:
+                logger.warning(
+                    "Unknown result %r of TF test %r.", testcase.get("result"), name
+                )
+                result = TestingFarmResult.unknown
+            logs = testcase.findall("logs/log")
+            results.append(
+                TestResult(
+                    name=name,
+                    result=result,
+                    log_url=logs[1].get("href", "") if len(logs) > 1 else "",
+                )
+            )
+        return results
 
     @staticmethod
     def parse_testing_farm_results_event(
@@ -756,7 +884,7 @@ class Parser:
             return None
 
         request_id: str = event["request_id"]
-        logger.info(f"Testing farm notification event. Request ID: {request_id}")
+        logger.info("Testing farm notification event. Request ID: %s", request_id)
 
         tft_test_run = TFTTestRunModel.get_by_pipeline_id(request_id)
 
@@ -765,10 +893,15 @@ class Parser:
         # It'd be much better to do this in TestingFarmResultsHandler.run(),
         # but all the code along the way to get there expects we already know the details.
         # TODO: Get missing info from db instead of querying TF
-        event = TestingFarmJobHelper.get_request_details(request_id)
+        event = Parser.tf_request_details_cache.get(request_id)
         if not event:
-            # Something's wrong with TF, raise exception so that we can re-try later.
-            raise Exception(f"Failed to get {request_id} details from TF.")
+            event = TestingFarmJobHelper.get_request_details(request_id)
+            if not event:
+                # Something's wrong with TF, raise exception so that we can re-try later.
+                raise Exception(f"Failed to get {request_id} details from TF.")
+            # finished requests don't change, repeated notifications can reuse them
+            if event.get("state") in TESTING_FARM_FINAL_STATES:
+                Parser.tf_request_details_cache.set(request_id, event)
 
         result: TestingFarmResult = TestingFarmResult(
             nested_get(event, "result", "overall") or event.get("state") or "unknown"
@@ -798,7 +931,7 @@ class Parser:
                 copr_build_id = artifact["id"].split(":")[0]
                 copr_chroot = artifact["id"].split(":")[1]
             else:
-                logger.error(f"{a_type} != fedora-copr-build")
+                logger.error("%s != fedora-copr-build", a_type)
                 copr_build_id = copr_chroot = ""
 
         if not copr_chroot and tft_test_run:
@@ -806,20 +939,27 @@ class Parser:
 
         # ["test"]["fmf"]["url"] contains PR's source/fork url or TF's install test url.
         # We need the original/base project url stored in db.
-        if tft_test_run and tft_test_run.data:
-            base_project_url = tft_test_run.data.get("base_project_url")
-            if base_project_url and base_project_url != project_url:
-                logger.debug(
-                    f"Using project url {base_project_url} instead of {project_url}"
-                )
-                project_url = base_project_url
+        tft_test_run_data = tft_test_run.data if tft_test_run else None
+        base_project_url = (
+            tft_test_run_data.get("base_project_url") if tft_test_run_data else None
+        )
+        if base_project_url and base_project_url != project_url:
+            logger.debug(
+                "Using project url %s instead of %s", base_project_url, project_url
+            )
+            project_url = base_project_url
 
         # Temporary until we have a better logs page.
         log_url: str = f"http://artifacts.dev.testing-farm.io/{request_id}"
 
         logger.debug(
-            f"project_url: {project_url}, ref: {ref}, result: {result}, "
-            f"summary: {summary!r}, copr-build: {copr_build_id}:{copr_chroot}"
+            "project_url: %s, ref: %s, result: %s, summary: %r, copr-build: %s:%s",
+            project_url,
+            ref,
+            result,
+            summary,
+            copr_build_id,
+            copr_chroot,
         )
 
         return TestingFarmResultsEvent(
@@ -840,16 +980,12 @@ class Parser:
         """this corresponds to copr build event e.g:"""
         topic = event.get("topic")
 
-        copr_build_cls: Type["AbstractCoprBuildEvent"]
-        if topic == "org.fedoraproject.prod.copr.build.start":
-            copr_build_cls = CoprBuildStartEvent
-        elif topic == "org.fedoraproject.prod.copr.build.end":
-            copr_build_cls = CoprBuildEndEvent
-        else:
+        copr_build_cls = COPR_BUILD_EVENTS.get(topic)
+        if not copr_build_cls:
             # Topic not supported.
             return None
 
-        logger.info(f"Copr event; {event.get('what')}")
+        logger.info("Copr event; %s", event.get("what"))
 
         build_id = event.get("build")
         chroot = event.get("chroot")
@@ -865,26 +1001,32 @@ class Parser:
 
     @staticmethod
     def parse_koji_event(event) -> Optional[KojiBuildEvent]:
-        if event.get("topic") != "org.fedoraproject.prod.buildsys.task.state.change":
+        if event.get("topic") != KOJI_TASK_STATE_TOPIC:
             return None
 
         build_id = event.get("id")
-        logger.info(f"Koji event: build_id={build_id}")
+        logger.info("Koji event: build_id=%s", build_id)
 
-        state = nested_get(event, "info", "state")
+        info = event.get("info") or {}
+        state = info.get("state")
 
         if not state:
             logger.debug("Cannot find build state.")
             return None
 
-        state_enum = KojiBuildState(event.get("new")) if "new" in event else None
-        old_state = KojiBuildState(event.get("old")) if "old" in event else None
+        state_enum = KOJI_BUILD_STATES.get(event.get("new"))
+        old_state = KOJI_BUILD_STATES.get(event.get("old"))
+        if ("new" in event and not state_enum) or ("old" in event and not old_state):
+            logger.warning(
+                "Unknown Koji task state: %r -> %r.", event.get("old"), event.get("new")
+            )
+            return None
 
-        start_time = nested_get(event, "info", "start_time")
-        completion_time = nested_get(event, "info", "completion_time")
+        start_time = info.get("start_time")
+        completion_time = info.get("completion_time")
 
         rpm_build_task_id = None
-        for children in nested_get(event, "info", "children", default=[]):
+        for children in info.get("children") or []:
             if children.get("method") == "buildArch":
                 rpm_build_task_id = children.get("id")
                 break
@@ -904,33 +1046,26 @@ class CentosEventParser:
     Class responsible for parsing events received from CentOS infrastructure
     """
 
-    def __init__(self):
-        """
-        self.event_mapping: dictionary mapping of topics to corresponding parsing methods
-
-        ..note: action in partial is github counterpart value, as this value is used in code
-
-            e.g.
-            pagure pull-request.update == github pull-request.synchronize -> in code is used
-            synchronize
-        """
-        self.event_mapping = {
-            "pull-request.new": partial(self._pull_request_event, action="opened"),
-            "pull-request.reopened": partial(
-                self._pull_request_event, action="reopened"
-            ),
-            "pull-request.updated": partial(
-                self._pull_request_event, action="synchronize"
-            ),
-            "pull-request.comment.added": partial(
-                self._pull_request_comment, action="added"
-            ),
-            "pull-request.comment.edited": partial(
-                self._pull_request_comment, action="edited"
-            ),
-            "pull-request.tag.added": partial(self._pull_request_label, action="added"),
-            "git.receive": self._push_event,
-        }
+    # topic -> (name of the parsing method, action passed to it)
+    # The action is the GitHub counterpart of the Pagure one as that value is used in code,
+    # e.g. pagure pull-request.updated == github pull-request.synchronize -> synchronize
+    # Built once for the class, a new parser is created for every message.
+    event_mapping: Dict[str, Tuple[str, Optional[Enum]]] = {
+        "pull-request.new": ("_pull_request_event", PullRequestAction.opened),
+        "pull-request.reopened": ("_pull_request_event", PullRequestAction.reopened),
+        "pull-request.updated": ("_pull_request_event", PullRequestAction.synchronize),
+        # edited comments are processed the same way as the new ones
+        "pull-request.comment.added": (
+            "_pull_request_comment",
+            PullRequestCommentAction.created,
+        ),
+        "pull-request.comment.edited": (
+            "_pull_request_comment",
+            PullRequestCommentAction.created,
+        ),
+        "pull-request.tag.added": ("_pull_request_label", PullRequestLabelAction.added),
+        "git.receive": ("_push_event", None),
+    }
 
     def parse_event(self, event: dict) -> Optional[AbstractPagureEvent]:
         """
@@ -938,7 +1073,7 @@ class CentosEventParser:
         :param event: contains event data
         :return: event object or None
         """
-        logger.debug(f"Parsing {event.get('topic')}")
+        logger.debug("Parsing %s", event.get("topic"))
 
         # e.g. "topic": "git.stg.centos.org/pull-request.tag.added"
         source, git_topic = event.get("topic").split("/")
@@ -946,13 +1081,17 @@ class CentosEventParser:
         event["git_topic"] = git_topic
 
         if git_topic not in self.event_mapping:
-            logger.info(f"Event type {git_topic!r} is not processed.")
+            logger.info("Event type %r is not processed.", git_topic)
             return None
 
-        return self.event_mapping[git_topic](event)
+        method_name, action = self.event_mapping[git_topic]
+        method = getattr(self, method_name)
+        return method(event) if action is None else method(event, action=action)
 
     @staticmethod
-    def _pull_request_event(event: dict, action: str) -> PullRequestPagureEvent:
+    def _pull_request_event(
+        event: dict, action: PullRequestAction
+    ) -> PullRequestPagureEvent:
         pullrequest = event["pullrequest"]
         pr_id = pullrequest["id"]
         base_repo_namespace = pullrequest["repo_from"]["namespace"]
@@ -965,7 +1104,7 @@ class CentosEventParser:
         pagure_login = pullrequest["user"]["name"]
 
         return PullRequestPagureEvent(
-            action=PullRequestAction[action],
+            action=action,
             pr_id=pr_id,
             base_repo_namespace=base_repo_namespace,
             base_repo_name=base_repo_name,
@@ -979,36 +1118,33 @@ class CentosEventParser:
 
     @staticmethod
     def _pull_request_comment(
-        event: dict, action: str
+        event: dict, action: PullRequestCommentAction
     ) -> PullRequestCommentPagureEvent:
-        event[
-            "https_url"
-        ] = f"https://{event['source']}/{event['pullrequest']['project']['url_path']}"
-        action = PullRequestCommentAction.created.value
-        pr_id = event["pullrequest"]["id"]
-        base_repo_namespace = event["pullrequest"]["project"]["namespace"]
-        base_repo_name = event["pullrequest"]["project"]["name"]
-        base_repo_owner = event["pullrequest"]["repo_from"]["user"]["name"]
-        target_repo = event["pullrequest"]["repo_from"]["name"]
-        https_url = (
-            f"https://{event['source']}/{event['pullrequest']['project']['url_path']}"
-        )
+        pullrequest = event["pullrequest"]
+        project = pullrequest["project"]
+        repo_from = pullrequest["repo_from"]
+        pr_id = pullrequest["id"]
+        base_repo_namespace = project["namespace"]
+        base_repo_name = project["name"]
+        base_repo_owner = repo_from["user"]["name"]
+        target_repo = repo_from["name"]
+        https_url = f"https://{event['source']}/{project['url_path']}"
         pagure_login = event["agent"]
-        commit_sha = event["pullrequest"]["commit_stop"]
+        commit_sha = pullrequest["commit_stop"]
 
         # gets comment from event.
         # location differs based on topic (pull-request.comment.edited/pull-request.comment.added)
         if "edited" in event["git_topic"]:
             comment = event["comment"]["comment"]
         elif "added" in event["git_topic"]:
-            comment = event["pullrequest"]["comments"][-1]["comment"]
+            comment = pullrequest["comments"][-1]["comment"]
         else:
             raise ValueError(
                 f"Unknown comment location in response for {event['git_topic']}"
             )
 
         return PullRequestCommentPagureEvent(
-            action=PullRequestCommentAction[action],
+            action=action,
             pr_id=pr_id,
             base_repo_namespace=base_repo_namespace,
             base_repo_name=base_repo_name,
@@ -1022,13 +1158,15 @@ class CentosEventParser:
         )
 
     @staticmethod
-    def _pull_request_label(event: dict, action: str) -> PullRequestLabelPagureEvent:
+    def _pull_request_label(
+        event: dict, action: PullRequestLabelAction
+    ) -> PullRequestLabelPagureEvent:
         # Yes, API really uses "pull_request" in this case and "pullrequest" in others.
         # Fallback to "pullrequest" in case it gets 'synchronized' in future.
         pr: Dict = event.get("pull_request") or event["pullrequest"]
 
         return PullRequestLabelPagureEvent(
-            action=PullRequestLabelAction[action],
+            action=action,
             pr_id=pr["id"],
             base_repo_namespace=pr["project"]["namespace"],
             base_repo_name=pr["project"]["name"],
@@ -1,7 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from packit.config import JobConfig
 from packit_service.service.events import Event
@@ -29,11 +29,16 @@ class TaskResults(dict):
 
     @classmethod
     def create_from(
-        cls, success: bool, msg: str, event: Event, job_config: JobConfig = None
+        cls,
+        success: bool,
+        msg: str,
+        event: Event,
+        job_config: JobConfig = None,
+        event_dict: Optional[dict] = None,
     ):
         details = {
             "msg": msg,
-            "event": event.get_dict(),
+            "event": event.get_dict() if event_dict is None else event_dict,
             "package_config": dump_package_config(event.package_config),
         }
 
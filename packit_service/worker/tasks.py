@@ -6,7 +6,9 @@ from os import getenv
 from typing import List, Optional
 
 from celery import Task
+from celery.signals import worker_init
 from packit_service.celerizer import celery_app
+from packit_service.config import ServiceConfig
 from packit_service.constants import DEFAULT_RETRY_LIMIT, DEFAULT_RETRY_BACKOFF
 from packit_service.utils import load_job_config, load_package_config
 from packit_service.worker.build.babysit import check_copr_build
@@ -48,6 +50,15 @@ logging.getLogger("packit").setLevel(logging.DEBUG)
 logging.getLogger("sandcastle").setLevel(logging.DEBUG)
 
 
+@worker_init.connect
+def preload_service_config(**_):
+    """
+    Load the service config in the main worker process before the pool is forked
+    so that the pool processes don't need to load it on their own.
+    """
+    ServiceConfig.preload()
+
+
 class HandlerTaskWithRetry(Task):
     autoretry_for = (Exception,)
     retry_kwargs = {
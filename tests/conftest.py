@@ -10,7 +10,7 @@ from flexmock import flexmock
 
 from ogr import GithubService, GitlabService
 from packit.config import JobConfigTriggerType
-from packit_service.config import ServiceConfig
+from packit_service.config import PackageConfigGetter, ServiceConfig
 from packit_service.models import JobTriggerModelType
 from packit_service.service.events import (
     PullRequestGithubEvent,
@@ -18,6 +18,7 @@ from packit_service.service.events import (
     ReleaseEvent,
     MergeRequestGitlabEvent,
 )
+from packit_service.service import urls
 from packit_service.worker.parser import Parser
 from tests.spellbook import SAVED_HTTPD_REQS, DATA_DIR
 
@@ -40,6 +41,14 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def clean_package_config_cache():
+    """Make sure values cached in one test are not reused in another one."""
+    PackageConfigGetter.cache.clear()
+    Parser.tf_request_details_cache.clear()
+    urls._get_dashboard_url.cache_clear()
+
+
 @pytest.fixture()
 def dump_http_com():
     """
@@ -360,7 +360,9 @@ def test_copr_build_end_testing_farm(copr_build_end, copr_build_pr):
             source_project=flexmock(get_web_url=lambda: "https://github.com/foo/bar")
         )
     )
-    urls.DASHBOARD_URL = "https://dashboard.localhost"
+    flexmock(urls).should_receive("_get_dashboard_url").and_return(
+        "https://dashboard.localhost"
+    )
 
     config = PackageConfig(
         jobs=[
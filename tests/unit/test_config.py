@@ -1,18 +1,25 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from pathlib import Path
 from typing import Optional
 
 import pytest
 from flexmock import flexmock
 from marshmallow import ValidationError
 
+import packit_service.config
 from ogr.abstract import GitProject, GitService
 from packit.config import PackageConfig
 from packit.exceptions import PackitConfigException
 from packit.sync import SyncFilesItem
-from packit_service.config import ServiceConfig, Deployment, PackageConfigGetter
-from packit_service.constants import TESTING_FARM_API_URL
+from packit_service.config import (
+    Deployment,
+    PackageConfigGetter,
+    ProjectToSync,
+    ServiceConfig,
+)
+from packit_service.constants import CONFIG_FILE_NAME, TESTING_FARM_API_URL
 
 try:
     from packit.config import SyncFilesConfig
@@ -150,6 +157,44 @@ def test_config_opts(sc):
     assert sc.gitlab_webhook_tokens is not None
 
 
+def test_get_project_to_sync():
+    first = ProjectToSync("https://github.com", "ns", "repo", "main", "repo", "f34")
+    second = ProjectToSync("https://github.com", "ns", "other", "main", "repo", "f34")
+    config = ServiceConfig(projects_to_sync=[first, second])
+    assert config.get_project_to_sync("repo", "f34") is first
+    assert config.get_project_to_sync("repo", "f35") is None
+
+    config.projects_to_sync = [second]
+    assert config.get_project_to_sync("repo", "f34") is second
+
+
+@pytest.fixture()
+def config_in_home(tmp_path):
+    config_dir = tmp_path / ".config"
+    config_dir.mkdir()
+    (config_dir / CONFIG_FILE_NAME).write_text(
+        "deployment: prod\nserver_name: hub.packit.org\n"
+    )
+    flexmock(Path).should_receive("home").and_return(tmp_path)
+
+    original_config = ServiceConfig.service_config
+    ServiceConfig.service_config = None
+    yield config_dir
+    ServiceConfig.service_config = original_config
+
+
+def test_get_service_config_loaded_once(config_in_home):
+    ServiceConfig.preload()
+    config = ServiceConfig.service_config
+    assert config.deployment == Deployment.prod
+    assert config.server_name == "hub.packit.org"
+
+    flexmock(ServiceConfig).should_receive("get_from_dict").never()
+    assert ServiceConfig.get_service_config() is config
+    # nothing with the parsed config (and its secrets) is written next to the file
+    assert [path.name for path in config_in_home.iterdir()] == [CONFIG_FILE_NAME]
+
+
 @pytest.mark.skipif(
     "SyncFilesConfig" not in globals(),
     reason="Remove after braking change in Packit is released.",
@@ -394,3 +439,47 @@ def test_create_issue_if_needed(issues, create_new, title, message):
 
     issue_created = PackageConfigGetter.create_issue_if_needed(project, title, message)
     assert check(issue_created)
+
+
+COMMIT_SHA = "0a1b2c3d4e5f60718293a4b5c6d7e8f901234567"
+
+
+def test_get_package_config_from_repo_cached():
+    gp = flexmock(GitProject)
+    gp.should_receive("full_repo_name").and_return("a/b")
+    gp.should_receive("get_file_content").with_args(
+        path=".packit.yaml", ref=COMMIT_SHA
+    ).and_return("---\nspecfile_path: packit.spec\n").once()
+    project = GitProject(repo="", service=GitService(), namespace="")
+
+    first = PackageConfigGetter.get_package_config_from_repo(
+        project=project, reference=COMMIT_SHA, spec_file_path="packit.spec"
+    )
+    first.specfile_path = "changed.spec"
+    second = PackageConfigGetter.get_package_config_from_repo(
+        project=project, reference=COMMIT_SHA, spec_file_path="packit.spec"
+    )
+    assert second.specfile_path == "packit.spec"
+
+
+@pytest.mark.parametrize("reference", ["main", COMMIT_SHA[:7], None])
+def test_fetch_package_config_branch_not_cached(reference):
+    project = flexmock(service=flexmock(), full_repo_name="a/b")
+    flexmock(packit_service.config).should_receive(
+        "get_package_config_from_repo"
+    ).and_return(PackageConfig(specfile_path="packit.spec")).twice()
+
+    for _ in range(2):
+        assert PackageConfigGetter.fetch_package_config(project, reference)
+    assert len(PackageConfigGetter.cache) == 0
+
+
+def test_fetch_package_config_missing_not_cached():
+    project = flexmock(service=flexmock(), full_repo_name="a/b")
+    flexmock(packit_service.config).should_receive(
+        "get_package_config_from_repo"
+    ).and_return(None).and_return(PackageConfig(specfile_path="packit.spec")).twice()
+
+    assert not PackageConfigGetter.fetch_package_config(project, COMMIT_SHA)
+    # the config has been added in the meantime
+    assert PackageConfigGetter.fetch_package_config(project, COMMIT_SHA)
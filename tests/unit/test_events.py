@@ -49,7 +49,9 @@ from packit_service.service.events import (
     IssueCommentGitlabEvent,
     MergeRequestCommentGitlabEvent,
     PushGitlabEvent,
+    Event,
     EventData,
+    parse_iso_datetime,
 )
 from packit_service.worker.parser import Parser, CentosEventParser
 from packit_service.worker.testing_farm import TestingFarmJobHelper
@@ -389,6 +391,12 @@ class TestEvents:
         ).once()
         assert event_object.package_config
 
+    def test_parse_pr_comment_from_packit(self, github_pr_comment_created):
+        comment_user = github_pr_comment_created["comment"]["user"]
+        comment_user["login"] = "packit-as-a-service[bot]"
+
+        assert not Parser.parse_pull_request_comment_event(github_pr_comment_created)
+
     def test_parse_pr_comment_empty(self, github_pr_comment_empty):
         event_object = Parser.parse_event(github_pr_comment_empty)
 
@@ -563,6 +571,21 @@ class TestEvents:
         ).once()
         assert event_object.package_config
 
+    @pytest.mark.parametrize(
+        "ref,git_ref",
+        [
+            ("refs/heads/main", "main"),
+            ("refs/heads/feature/ref-with-slash", "feature/ref-with-slash"),
+            ("refs/tags/0.1.0", "0.1.0"),
+        ],
+    )
+    def test_parse_push_git_ref(self, github_push_branch, gitlab_push, ref, git_ref):
+        github_push_branch["ref"] = ref
+        gitlab_push["ref"] = ref
+
+        assert Parser.parse_event(github_push_branch).git_ref == git_ref
+        assert Parser.parse_event(gitlab_push).git_ref == git_ref
+
     def test_parse_gitlab_push_many_commits(self, gitlab_push_many_commits):
         event_object = Parser.parse_event(gitlab_push_many_commits)
 
@@ -690,6 +713,26 @@ class TestEvents:
         assert isinstance(event_object.project, GithubProject)
         assert event_object.project.full_repo_name == "packit/packit"
 
+    def test_parse_testing_farm_notification_cached(
+        self, testing_farm_notification, testing_farm_results
+    ):
+        request_id = "129bd474-e4d3-49e0-9dec-d994a99feebc"
+        flexmock(TestingFarmJobHelper).should_receive("get_request_details").with_args(
+            request_id
+        ).and_return(testing_farm_results).once()
+        flexmock(TFTTestRunModel).should_receive("get_by_pipeline_id").and_return(
+            flexmock(
+                job_trigger=flexmock(),
+                data={"base_project_url": "https://github.com/packit/packit"},
+                commit_sha="12345",
+            )
+        )
+
+        for _ in range(2):
+            event_object = Parser.parse_event(testing_farm_notification)
+            assert isinstance(event_object, TestingFarmResultsEvent)
+            assert event_object.result == TestingFarmResult.passed
+
     def test_parse_copr_build_event_start(
         self, copr_build_results_start, copr_build_pr
     ):
@@ -733,6 +776,26 @@ class TestEvents:
 
         assert event_object.package_config
 
+    def test_copr_build_event_trigger_fetched_once(self, copr_build_results_start):
+        copr_build = copr_build_model()
+        trigger = copr_build.get_trigger_object()
+        flexmock(copr_build).should_receive("get_trigger_object").and_return(
+            trigger
+        ).once()
+        flexmock(CoprBuildModel).should_receive("get_by_build_id").and_return(
+            copr_build
+        )
+
+        event_object = Parser.parse_event(copr_build_results_start)
+
+        assert event_object.db_trigger is trigger
+        assert event_object.db_trigger is trigger
+        event_dict = event_object.get_dict()
+        assert "_db_trigger" not in event_dict
+        assert event_dict["trigger_id"] == trigger.id
+        assert event_dict["topic"] == FedmsgTopic.copr_build_started.value
+        assert json.loads(json.dumps(event_dict)) == event_dict
+
     def test_parse_copr_build_event_end(self, copr_build_results_end, copr_build_pr):
         flexmock(CoprBuildModel).should_receive("get_by_build_id").and_return(
             copr_build_pr
@@ -815,6 +878,11 @@ class TestEvents:
         assert event_object.package_config
         """
 
+    def test_parse_koji_build_unknown_state(self, koji_build_scratch_start):
+        koji_build_scratch_start["new"] = "EXPLODED"
+
+        assert not Parser.parse_koji_event(koji_build_scratch_start)
+
     def test_parse_koji_build_scratch_event_end(
         self, koji_build_scratch_end, koji_build_pr
     ):
@@ -1271,3 +1339,136 @@ def test_event_data_parse_pr(github_pr_event):
     assert data.commit_sha == "528b803be6f93e19ca4130bf4976f2800a3004c4"
     assert data.identifier == "342"
     assert data.pr_id == 342
+
+
+def test_event_missing_project_fetched_once(github_pr_webhook):
+    event = Parser.parse_pr_event(github_pr_webhook)
+    flexmock(event).should_receive("get_base_project").and_return(None).once()
+    assert event.base_project is None
+    assert event.base_project is None
+
+
+def test_event_get_dict_enum_values(github_pr_event):
+    flexmock(PullRequestGithubEvent).should_receive("db_trigger").and_return(None)
+    event_dict = github_pr_event.get_dict()
+    assert event_dict["action"] == PullRequestAction.opened.value
+    assert set(event_dict) == {
+        "_pr_id",
+        "action",
+        "base_ref",
+        "base_repo_name",
+        "base_repo_namespace",
+        "commit_sha",
+        "created_at",
+        "event_type",
+        "git_ref",
+        "identifier",
+        "project_url",
+        "target_repo_name",
+        "target_repo_namespace",
+        "trigger_id",
+        "user_login",
+    }
+    assert json.loads(json.dumps(event_dict)) == event_dict
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [1600000000, 1600000000.7, "2020-09-13T12:26:40Z"],
+)
+def test_event_get_dict_created_at(created_at):
+    event_dict = Event(created_at=created_at).get_dict()
+    assert event_dict == {
+        "event_type": "Event",
+        "trigger_id": None,
+        "created_at": 1600000000,
+        "project_url": None,
+    }
+    assert json.loads(json.dumps(event_dict)) == event_dict
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (
+            "2020-09-15T08:21:05Z",
+            datetime(2020, 9, 15, 8, 21, 5, tzinfo=timezone.utc),
+        ),
+        (
+            "2020-09-15 08:21:05Z",
+            datetime(2020, 9, 15, 8, 21, 5, tzinfo=timezone.utc),
+        ),
+        (
+            "2020-09-15T08:21:05.123Z",
+            datetime(2020, 9, 15, 8, 21, 5, 123000, tzinfo=timezone.utc),
+        ),
+        (
+            "2020-09-15T10:21:05+02:00",
+            datetime(2020, 9, 15, 8, 21, 5, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_parse_iso_datetime(value, expected):
+    assert parse_iso_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2021/04/21 10x20x30Z",
+        "2021-04-21T10:20:30X",
+        "2021-04-21T10:2a:30Z",
+    ],
+)
+def test_parse_iso_datetime_invalid(value):
+    with pytest.raises(ValueError):
+        parse_iso_datetime(value)
+
+
+@pytest.mark.parametrize(
+    "event,parsers",
+    [
+        (
+            {"topic": "org.fedoraproject.prod.copr.build.end"},
+            (Parser.parse_copr_event,),
+        ),
+        (
+            {"topic": "org.fedoraproject.prod.buildsys.task.state.change"},
+            (Parser.parse_koji_event,),
+        ),
+        (
+            {"source": "testing-farm", "request_id": "123"},
+            (Parser.parse_testing_farm_results_event,),
+        ),
+        (
+            {"object_kind": "note"},
+            (
+                Parser.parse_merge_request_comment_event,
+                Parser.parse_gitlab_issue_comment_event,
+            ),
+        ),
+        (
+            {"action": "opened", "number": 1, "pull_request": {}},
+            (Parser.parse_pr_event,),
+        ),
+        (
+            {"action": "created", "issue": {}, "comment": {}},
+            (
+                Parser.parse_pull_request_comment_event,
+                Parser.parse_issue_comment_event,
+            ),
+        ),
+        (
+            {"ref": "refs/heads/main", "pusher": {}},
+            (Parser.parse_push_event,),
+        ),
+    ],
+)
+def test_get_parsers_for_event(event, parsers):
+    assert Parser.get_parsers_for_event(event) == parsers
+
+
+def test_get_parsers_for_event_unknown():
+    parsers = Parser.get_parsers_for_event({"action": "opened"})
+    assert Parser.parse_pr_event in parsers
+    assert Parser.parse_copr_event in parsers
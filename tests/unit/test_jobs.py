@@ -36,10 +36,13 @@ from packit_service.worker.handlers.github_handlers import (
     ProposeDownstreamHandler,
     TestingFarmHandler,
 )
+from packit_service.worker.handlers.abstract import MAP_COMMENT_TO_HANDLER
 from packit_service.worker.jobs import (
     get_config_for_handler_kls,
+    get_handlers_for_comment,
     get_handlers_for_event,
 )
+from packit_service.worker.result import TaskResults
 
 
 @pytest.mark.parametrize(
@@ -1697,3 +1700,24 @@ def test_get_config_for_handler_kls(
         package_config=flexmock(jobs=jobs),
     )
     assert job_config == result_job_config
+
+
+def test_get_handlers_for_comment_unknown_command():
+    assert get_handlers_for_comment("/packit unknown-command") == set()
+    assert "unknown-command" not in MAP_COMMENT_TO_HANDLER
+
+
+def test_serialized_event_is_reused():
+    event = flexmock(package_config=None)
+    event.should_receive("get_dict").never()
+    event_dict = {"event_type": "PullRequestGithubEvent"}
+
+    signature = CoprBuildHandler.get_signature(
+        event=event, job=None, event_dict=event_dict
+    )
+    assert signature.kwargs["event"] is event_dict
+
+    result = TaskResults.create_from(
+        success=True, msg="Job created.", event=event, event_dict=event_dict
+    )
+    assert result["details"]["event"] is event_dict
@@ -1,6 +1,8 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import pytest
+
 from packit_service.models import TestingFarmResult
 from packit_service.service.events import TestResult
 from packit_service.worker.parser import Parser
@@ -55,3 +57,50 @@ def test_parse_tf_result_xunit():
         ),
     ]
     assert Parser._parse_tf_result_xunit(xunit_str) == results
+
+
+def test_parse_tf_result_xunit_single_testcase():
+    xunit_str = (
+        '<testsuites overall-result="failed">'
+        '<testsuite overall-result="failed" tests="1">'
+        '<testcase name="/smoke" result="failed">'
+        "<logs>"
+        '<log href="https://example.com/smoke" name="log_dir"/>'
+        '<log href="https://example.com/smoke/out.log" name="testout.log"/>'
+        "</logs>"
+        "</testcase>"
+        "</testsuite>"
+        "</testsuites>"
+    )
+    assert Parser._parse_tf_result_xunit(xunit_str) == [
+        TestResult(
+            name="/smoke",
+            result=TestingFarmResult.failed,
+            log_url="https://example.com/smoke/out.log",
+        )
+    ]
+
+
+def test_parse_tf_result_xunit_invalid():
+    assert Parser._parse_tf_result_xunit("<testsuites><testsuite>") == []
+
+
+def test_parse_tf_result_xunit_unknown_result():
+    xunit_str = (
+        "<testsuites><testsuite>"
+        '<testcase name="/smoke" result="exploded"/>'
+        "</testsuite></testsuites>"
+    )
+    assert Parser._parse_tf_result_xunit(xunit_str) == [
+        TestResult(name="/smoke", result=TestingFarmResult.unknown, log_url="")
+    ]
+
+
+def test_test_result_slots():
+    test_result = TestResult(
+        name="/smoke", result=TestingFarmResult.passed, log_url="https://log"
+    )
+    assert test_result.result == test_result["result"] == TestingFarmResult.passed
+    assert not hasattr(test_result, "__dict__")
+    with pytest.raises(AttributeError):
+        test_result.duration = 1
@@ -200,7 +200,9 @@ def test_testing_farm_response(
         check_names="packit-stg/testing-farm-fedora-rawhide-x86_64",
     )
 
-    urls.DASHBOARD_URL = "https://dashboard.localhost"
+    flexmock(urls).should_receive("_get_dashboard_url").and_return(
+        "https://dashboard.localhost"
+    )
     tft_test_run_model = flexmock(id=123)
     tft_test_run_model.should_receive("set_status").with_args(
         tests_result
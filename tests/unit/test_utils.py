@@ -1,7 +1,12 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from packit_service.utils import only_once
+from threading import Thread
+
+from flexmock import flexmock
+
+from packit_service import utils
+from packit_service.utils import TimedLRUCache, only_once
 
 
 def test_only_once():
@@ -74,3 +79,49 @@ def test_only_once_with_args_and_kwargs():
     assert counter == 1
     f("b", "b", three="different")
     assert counter == 1
+
+
+def test_timed_lru_cache_size():
+    cache = TimedLRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    # "b" is the least recently used one
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_timed_lru_cache_ttl():
+    now = 100
+    flexmock(utils.time).should_receive("monotonic").replace_with(lambda: now)
+    cache = TimedLRUCache(maxsize=2, ttl=60)
+    cache.set("a", None)
+
+    now = 150
+    assert "a" in cache
+    assert cache.get("a", "default") is None
+
+    now = 220
+    assert cache.get("a", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_timed_lru_cache_threads():
+    cache = TimedLRUCache(maxsize=8, ttl=60)
+
+    def use_cache(offset):
+        for i in range(1000):
+            cache.set((offset + i) % 16, i)
+            cache.get((offset + i + 1) % 16)
+
+    threads = [Thread(target=use_cache, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 8
@@ -4,11 +4,13 @@
 """
 Let's test flask views.
 """
+import importlib
 from datetime import datetime
 
 import pytest
 from flexmock import flexmock
 
+from packit_service.config import ServiceConfig
 from packit_service.models import (
     CoprBuildModel,
     JobTriggerModelType,
@@ -29,7 +31,7 @@ def client():
     application.config["SERVER_NAME"] = "localhost:5000"
     application.config["PREFERRED_URL_SCHEME"] = "https"
 
-    urls.DASHBOARD_URL = "https://localhost"
+    flexmock(urls).should_receive("_get_dashboard_url").and_return("https://localhost")
 
     with application.test_client() as client:
         yield client
@@ -47,6 +49,26 @@ def _setup_app_context_for_test():
     ctx.pop()
 
 
+def test_dashboard_url_not_loaded_on_import():
+    flexmock(ServiceConfig).should_receive("get_service_config").never()
+    importlib.reload(urls)
+
+
+def test_dashboard_url_loaded_on_first_use():
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(dashboard_url="https://dashboard.packit.dev")
+    ).once()
+
+    assert (
+        get_copr_build_info_url(1)
+        == "https://dashboard.packit.dev/results/copr-builds/1"
+    )
+    assert (
+        get_srpm_build_info_url(2)
+        == "https://dashboard.packit.dev/results/srpm-builds/2"
+    )
+
+
 def test_get_logs(client):
     chroot = "foo-1-x86_64"
     state = "success"
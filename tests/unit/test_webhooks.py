@@ -88,7 +88,8 @@ def test_validate_token(mock_config, headers, is_good):
     temp = webhooks.GitlabWebhook()
     with Flask(__name__).test_request_context():
         request._cached_data = request.data = payload
-        request.headers = headers
+        # GitLab sends the payload as JSON
+        request.headers = {**headers, "Content-Type": "application/json"}
         if not is_good:
             with pytest.raises(ValidationFailed):
                 webhooks.GitlabWebhook.validate_token(temp)
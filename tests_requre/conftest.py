@@ -16,7 +16,7 @@ $ alembic upgrade head
 import pytest
 
 from ogr import GithubService, GitlabService, PagureService
-from packit_service.config import ServiceConfig
+from packit_service.config import PackageConfigGetter, ServiceConfig
 from packit_service.models import (
     CoprBuildModel,
     JobTriggerModel,
@@ -38,6 +38,8 @@ from packit_service.models import (
     ProjectAuthenticationIssueModel,
 )
 from packit_service.service.events import InstallationEvent
+from packit_service.service import urls
+from packit_service.worker.parser import Parser
 
 
 class SampleValues:
@@ -119,6 +121,14 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def clean_package_config_cache():
+    """Make sure values cached in one test are not reused in another one."""
+    PackageConfigGetter.cache.clear()
+    Parser.tf_request_details_cache.clear()
+    urls._get_dashboard_url.cache_clear()
+
+
 def clean_db():
     with get_sa_session() as session:
 